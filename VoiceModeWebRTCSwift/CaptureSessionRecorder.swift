@@ -12,6 +12,8 @@ class CaptureSessionRecorder: NSObject, AVCaptureAudioDataOutputSampleBufferDele
     private var audioConverter: AVAudioConverter?
     private var inputFormat: AVAudioFormat?
     private var targetFormat: AVAudioFormat?
+    // Float scratch for PCMAudio.rms, reused across callbacks (only touched on workQueue)
+    private var rmsScratch: [Float] = []
     
     override init() {
         super.init()
@@ -179,22 +181,9 @@ class CaptureSessionRecorder: NSObject, AVCaptureAudioDataOutputSampleBufferDele
         let validByteCount = min(Int(audioBuffer.mDataByteSize), expectedByteCount)
         guard validByteCount > 0 else { return }
 
-        let pcmData = Data(bytes: outData, count: validByteCount)
-        guard !pcmData.isEmpty else { return }
+        let sampleCount = validByteCount / MemoryLayout<Int16>.size
+        let rms = PCMAudio.rms(of: outData.assumingMemoryBound(to: Int16.self), count: sampleCount, scratch: &rmsScratch)
 
-        let rms: Float = pcmData.withUnsafeBytes { rawBufferPointer in
-            let samples = rawBufferPointer.bindMemory(to: Int16.self)
-            guard !samples.isEmpty else { return 0 }
-
-            var sum: Float = 0
-            for sample in samples {
-                let value = Float(sample)
-                sum += value * value
-            }
-
-            return sqrt(sum / Float(samples.count))
-        }
-
-        self.onChunk?(pcmData.base64EncodedString(), rms)
+        self.onChunk?(PCMAudio.base64(outData, count: validByteCount), rms)
     }
 }
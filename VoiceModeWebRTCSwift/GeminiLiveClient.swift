@@ -184,7 +184,7 @@ final class GeminiLiveClientAdapter: NSObject {
             
             // Log first few chunks + periodic health check
             if self.audioChunkCount <= 10 || self.audioChunkCount % 500 == 1 {
-                let audioBytes = base64Audio.count * 3 / 4 // Approximate decoded size
+                let audioBytes = base64Audio.utf8.count * 3 / 4 // Approximate decoded size
                 
                 print("🎙️ Audio chunk #\(self.audioChunkCount) (\(audioBytes) bytes, RMS: \(String(format: "%.1f", rms)))")
             }
@@ -7,6 +7,15 @@ class LocalAudioRecorder: NSObject {
     private var audioConverter: AVAudioConverter?
     private var targetFormat: AVAudioFormat?
     
+    /// Buffers reused across tap callbacks. Owned by a single tap closure and only
+    /// touched on the audio thread, so stopRecording never races with it.
+    private final class TapBuffers {
+        // Converter output buffer (onChunk copies out of it synchronously)
+        var outputBuffer: AVAudioPCMBuffer?
+        // Float scratch for PCMAudio's vDSP passes
+        var gainScratch: [Float] = []
+    }
+    
     // Updated signature to include RMS (matched CaptureSessionRecorder)
     var onChunk: ((String, Float) -> Void)?
     
@@ -62,8 +71,9 @@ class LocalAudioRecorder: NSObject {
         audioConverter = AVAudioConverter(from: inputFormat, to: pcmFormat)
         
         // Buffer size: 100ms at 48kHz is ~4800 frames. 2048 is ~40ms. Low latency is good.
+        let tapBuffers = TapBuffers()
         inputNode?.installTap(onBus: 0, bufferSize: 2048, format: inputFormat) { [weak self] (buffer, time) in
-            self?.processBuffer(buffer: buffer)
+            self?.processBuffer(buffer: buffer, reusing: tapBuffers)
         }
         
         do {
@@ -83,14 +93,22 @@ class LocalAudioRecorder: NSObject {
         print("⏹️ LocalAudioRecorder stopped")
     }
     
-    private func processBuffer(buffer: AVAudioPCMBuffer) {
+    private func processBuffer(buffer: AVAudioPCMBuffer, reusing tapBuffers: TapBuffers) {
         guard let targetFormat = targetFormat, let converter = audioConverter else { return }
         
         // Calculate output buffer capacity
         let ratio = targetFormat.sampleRate / buffer.format.sampleRate
         let capacity = AVAudioFrameCount(Double(buffer.frameLength) * ratio) + 100
         
-        guard let outputBuffer = AVAudioPCMBuffer(pcmFormat: targetFormat, frameCapacity: capacity) else { return }
+        let outputBuffer: AVAudioPCMBuffer
+        if let reusable = tapBuffers.outputBuffer, reusable.format == targetFormat, reusable.frameCapacity >= capacity {
+            outputBuffer = reusable
+            outputBuffer.frameLength = 0
+        } else {
+            guard let freshBuffer = AVAudioPCMBuffer(pcmFormat: targetFormat, frameCapacity: capacity) else { return }
+            tapBuffers.outputBuffer = freshBuffer
+            outputBuffer = freshBuffer
+        }
         
         var error: NSError? = nil
         
@@ -119,29 +137,12 @@ class LocalAudioRecorder: NSObject {
             
             guard frameCount > 0 else { return }
             
-            // Apply Software Gain (Boosting sensitivity)
+            // Apply Software Gain (Boosting sensitivity); RMS is of the boosted signal
             let micGain: Float = 2.5
-            var sum: Float = 0
-            
-            for i in 0..<frameCount {
-                // Apply gain and clamp to Int16 range
-                let boostedSample = Float(channelPointer[i]) * micGain
-                let clampedSample = max(Float(Int16.min), min(Float(Int16.max), boostedSample))
-                let finalSample = Int16(clampedSample)
-                
-                // Update the buffer with boosted sample (for encoding)
-                channelPointer[i] = finalSample
-                
-                // Use boosted sample for RMS Calculation
-                sum += clampedSample * clampedSample
-            }
-            
-            let rms = sqrt(sum / Float(frameCount))
+            let rms = PCMAudio.applyGain(micGain, to: channelPointer, count: frameCount, scratch: &tapBuffers.gainScratch)
             
             // Base64 Encoding
-            let dataCount = frameCount * MemoryLayout<Int16>.size
-            let data = Data(bytes: channelPointer, count: dataCount)
-            let base64 = data.base64EncodedString()
+            let base64 = PCMAudio.base64(channelPointer, count: frameCount * MemoryLayout<Int16>.size)
             
             self.onChunk?(base64, rms)
         }
@@ -0,0 +1,68 @@
+import Foundation
+import Accelerate
+
+/// Shared helpers for the 16kHz Int16 mic chunks produced by
+/// LocalAudioRecorder and CaptureSessionRecorder.
+/// All per-sample work is done with vDSP so it runs as vectorized passes.
+/// Callers own a Float scratch buffer and pass it in on every chunk, so once it
+/// has grown to the chunk size the audio thread does no further allocation.
+enum PCMAudio {
+
+    private static func ensureCapacity(_ scratch: inout [Float], _ count: Int) {
+        if scratch.count < count {
+            scratch = [Float](repeating: 0, count: count)
+        }
+    }
+
+    /// Apply a software gain to Int16 samples in place (clamped to the Int16 range)
+    /// and return the RMS of the boosted signal.
+    static func applyGain(_ gain: Float, to samples: UnsafeMutablePointer<Int16>, count: Int, scratch: inout [Float]) -> Float {
+        guard count > 0 else { return 0 }
+
+        var gain = gain
+        var lowerBound = Float(Int16.min)
+        var upperBound = Float(Int16.max)
+        var rms: Float = 0
+        let length = vDSP_Length(count)
+
+        ensureCapacity(&scratch, count)
+        scratch.withUnsafeMutableBufferPointer { buffer in
+            guard let floats = buffer.baseAddress else { return }
+
+            // Int16 -> Float, apply gain and clamp to Int16 range
+            vDSP_vflt16(samples, 1, floats, 1, length)
+            vDSP_vsmul(floats, 1, &gain, floats, 1, length)
+            vDSP_vclip(floats, 1, &lowerBound, &upperBound, floats, 1, length)
+
+            vDSP_rmsqv(floats, 1, &rms, length)
+
+            // Write the boosted samples back (truncating, like Int16(Float))
+            vDSP_vfix16(floats, 1, samples, 1, length)
+        }
+        return rms
+    }
+
+    /// RMS of Int16 samples, in raw sample units (0...32768).
+    static func rms(of samples: UnsafePointer<Int16>, count: Int, scratch: inout [Float]) -> Float {
+        guard count > 0 else { return 0 }
+
+        var rms: Float = 0
+        let length = vDSP_Length(count)
+
+        ensureCapacity(&scratch, count)
+        scratch.withUnsafeMutableBufferPointer { buffer in
+            guard let floats = buffer.baseAddress else { return }
+            vDSP_vflt16(samples, 1, floats, 1, length)
+            vDSP_rmsqv(floats, 1, &rms, length)
+        }
+        return rms
+    }
+
+    /// Base64-encode a PCM chunk for the realtime APIs.
+    /// Encodes straight from the caller's buffer (no intermediate Data copy),
+    /// so the buffer only has to stay valid for the duration of the call.
+    static func base64(_ bytes: UnsafeRawPointer, count: Int) -> String {
+        let view = Data(bytesNoCopy: UnsafeMutableRawPointer(mutating: bytes), count: count, deallocator: .none)
+        return view.base64EncodedString()
+    }
+}
@@ -116,6 +116,15 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
 
     private var geminiClient: GeminiLiveClientAdapter?
     private var xaiClient: XAILiveClient?
+    // xAI transcript updates waiting for the main queue; drained in batches
+    private struct XaiTranscriptUpdate {
+        let role: String
+        let text: String
+        let itemId: String
+        let isDelta: Bool
+    }
+    private var pendingXaiTranscriptUpdates: [XaiTranscriptUpdate] = []
+    private let xaiTranscriptInboxLock = NSLock()
     private var responseDebounceTimer: Timer?
     
     // Persistent MCP connection for background notifications
@@ -294,6 +303,13 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
     }
 
     func getLocalTools() -> [[String: Any]] {
+        return Self.localToolDefinitions
+    }
+
+    /// Local tool definitions are constant, so the literal is built once and shared
+    private static let localToolDefinitions = makeLocalToolDefinitions()
+
+    private static func makeLocalToolDefinitions() -> [[String: Any]] {
         return [
             [
                 "type": "function",
@@ -700,8 +716,14 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
     }
     
     // WebRTC references
+    // One factory for the app's lifetime: it owns the WebRTC signaling/worker
+    // threads, so it is created on first OpenAI connection and then reused.
+    private lazy var peerConnectionFactory = RTCPeerConnectionFactory()
     private var peerConnection: RTCPeerConnection?
     private var dataChannel: RTCDataChannel?
+    // Data channel events waiting for the main queue; drained in batches
+    private var pendingDataChannelMessages: [Data] = []
+    private let dataChannelInboxLock = NSLock()
     private var audioTrack: RTCAudioTrack?
     private var videoTrack: RTCVideoTrack?
     
@@ -710,6 +732,8 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
     private var videoOutput: AVCaptureVideoDataOutput?
     private var previewLayer: AVCaptureVideoPreviewLayer?
     private var currentCameraInput: AVCaptureDeviceInput?
+    // CIContext is expensive to create; reuse one for every captured frame
+    private let videoFrameContext = CIContext()
     
     // MARK: - Public Methods
     
@@ -2332,7 +2356,7 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
         let now = Date()
         if let lastId = lastGeminiAssistantItemId,
            now.timeIntervalSince(lastGeminiAssistantUpdateAt) <= geminiAssistantMergeWindow,
-           let index = conversation.firstIndex(where: { $0.id == lastId }) {
+           let index = conversation.lastIndex(where: { $0.id == lastId }) {
             let merged = mergeGeminiTranscript(existing: conversation[index].text, incoming: message.text)
             conversation[index].text = merged
             conversationMap[lastId] = conversation[index]
@@ -2350,7 +2374,7 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
         let now = Date()
         if let lastId = lastGeminiUserItemId,
            now.timeIntervalSince(lastGeminiUserUpdateAt) <= geminiUserMergeWindow,
-           let index = conversation.firstIndex(where: { $0.id == lastId }) {
+           let index = conversation.lastIndex(where: { $0.id == lastId }) {
             let merged = mergeGeminiTranscript(existing: conversation[index].text, incoming: message.text)
             conversation[index].text = merged
             conversationMap[lastId] = conversation[index]
@@ -2590,6 +2614,8 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
         }
 
         let task = URLSession.shared.webSocketTask(with: request)
+        // Tool results (e.g. screenshots) can exceed the 1 MiB default, which would kill the socket
+        task.maximumMessageSize = 16 * 1024 * 1024
         task.resume()
         
         mcpLock.withLock {
@@ -2606,14 +2632,15 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
             
             switch result {
             case .success(let message):
-                let text: String
+                // Binary frames are parsed as-is rather than round-tripped through String
+                let data: Data
                 switch message {
-                case .string(let s): text = s
-                case .data(let d): text = String(data: d, encoding: .utf8) ?? ""
-                @unknown default: text = ""
+                case .string(let s): data = Data(s.utf8)
+                case .data(let d): data = d
+                @unknown default: data = Data()
                 }
                 
-                self.handleIncomingMcpMessage(text)
+                self.handleIncomingMcpMessage(data)
                 self.startMcpListeningLoop(task: task)
                 
             case .failure(let error):
@@ -2627,9 +2654,8 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
         }
     }
 
-    private func handleIncomingMcpMessage(_ text: String) {
-        guard let data = text.data(using: .utf8),
-              let json = try? JSONSerialization.jsonObject(with: data) as? [String: Any] else { return }
+    private func handleIncomingMcpMessage(_ data: Data) {
+        guard let json = try? JSONSerialization.jsonObject(with: data) as? [String: Any] else { return }
         
         // 1. Check for RPC Response
         if let id = json["id"] as? String {
@@ -3945,19 +3971,17 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
 
             client.onMessageReceived = { [weak self] role, text, itemId, isDelta in
                 guard let self = self else { return }
+                
+                // Same inbox pattern as the OpenAI data channel: only hop to the main
+                // queue when the inbox was empty, so a burst of deltas is one block.
+                let shouldScheduleDrain = self.xaiTranscriptInboxLock.withLock { () -> Bool in
+                    self.pendingXaiTranscriptUpdates.append(XaiTranscriptUpdate(role: role, text: text, itemId: itemId, isDelta: isDelta))
+                    return self.pendingXaiTranscriptUpdates.count == 1
+                }
+                guard shouldScheduleDrain else { return }
+                
                 DispatchQueue.main.async {
-                    if let existingIdx = self.conversation.firstIndex(where: { $0.id == itemId }) {
-                        if isDelta {
-                            self.conversation[existingIdx].text += text
-                        } else {
-                            self.conversation[existingIdx].text = text
-                        }
-                        self.conversationMap[itemId] = self.conversation[existingIdx]
-                    } else {
-                        let newItem = ConversationItem(id: itemId, role: role, text: text)
-                        self.conversation.append(newItem)
-                        self.conversationMap[itemId] = newItem
-                    }
+                    self.drainPendingXaiTranscriptUpdates()
                 }
             }
 
@@ -4084,6 +4108,30 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
         }
     }
     
+    private func drainPendingXaiTranscriptUpdates() {
+        let batch = xaiTranscriptInboxLock.withLock { () -> [XaiTranscriptUpdate] in
+            let batch = pendingXaiTranscriptUpdates
+            pendingXaiTranscriptUpdates.removeAll(keepingCapacity: true)
+            return batch
+        }
+        
+        for update in batch {
+            // Streaming deltas almost always target the newest item, so search from the end
+            if let existingIdx = conversation.lastIndex(where: { $0.id == update.itemId }) {
+                if update.isDelta {
+                    conversation[existingIdx].text += update.text
+                } else {
+                    conversation[existingIdx].text = update.text
+                }
+                conversationMap[update.itemId] = conversation[existingIdx]
+            } else {
+                let newItem = ConversationItem(id: update.itemId, role: update.role, text: update.text)
+                conversation.append(newItem)
+                conversationMap[update.itemId] = newItem
+            }
+        }
+    }
+    
     func stopConnection() {
         stopVideo()
         
@@ -4181,11 +4229,8 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
         
         guard let dc = dataChannel else { return }
         
-        let realtimeEvent: [String: Any] = [ "type": "response.create" ]
-        if let jsonData = try? JSONSerialization.data(withJSONObject: realtimeEvent) {
-            let buffer = RTCDataBuffer(data: jsonData, isBinary: false)
-            dc.sendData(buffer)
-        }
+        let buffer = RTCDataBuffer(data: Self.responseCreateEvent, isBinary: false)
+        dc.sendData(buffer)
     }
     
     private func markAwaitingToolResponse(context: String) {
@@ -4275,12 +4320,35 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
     
     // MARK: - Private Methods
     
+    /// Pre-serialized "response.create" event; it never changes
+    private static let responseCreateEvent = Data("{\"type\":\"response.create\"}".utf8)
+    
+    /// Data channel events that are too frequent to log in full
+    private static let noisyDataChannelEvents: Set<String> = [
+        "response.audio_transcript.delta",
+        "response.audio.done",
+        "response.content_part.added",
+        "response.content_part.done",
+        "response.output_item.added",
+        "response.output_item.done",
+        "rate_limits.updated",
+        "input_audio_buffer.speech_started",
+        "input_audio_buffer.speech_stopped",
+        "input_audio_buffer.committed",
+        "conversation.item.input_audio_transcription.delta",
+        "conversation.item.input_audio_transcription.completed",
+        "response.function_call_arguments.delta",
+        "response.mcp_call_arguments.delta",
+        "output_audio_buffer.started",
+        "output_audio_buffer.stopped",
+        "output_audio_buffer.cleared"
+    ]
+    
     private func setupPeerConnection() {
         let config = RTCConfiguration()
         // If needed, configure ICE servers here
         let constraints = RTCMediaConstraints(mandatoryConstraints: nil, optionalConstraints: nil)
-        let factory = RTCPeerConnectionFactory()
-        peerConnection = factory.peerConnection(with: config, constraints: constraints, delegate: self)
+        peerConnection = peerConnectionFactory.peerConnection(with: config, constraints: constraints, delegate: self)
     }
     
     private func setLocalDescriptionAsync(_ connection: RTCPeerConnection, description: RTCSessionDescription) async throws {
@@ -4349,7 +4417,7 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
     
     private func setupLocalAudio() {
         guard let peerConnection = peerConnection else { return }
-        let factory = RTCPeerConnectionFactory()
+        let factory = peerConnectionFactory
         
         let constraints = RTCMediaConstraints(
             mandatoryConstraints: [
@@ -4399,38 +4467,17 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
         return answerSdp
     }
     
-    private func handleIncomingJSON(_ jsonString: String) {
-        guard let data = jsonString.data(using: .utf8),
-              let rawEvent = try? JSONSerialization.jsonObject(with: data),
+    private func handleIncomingJSON(_ data: Data) {
+        guard let rawEvent = try? JSONSerialization.jsonObject(with: data),
               let eventDict = rawEvent as? [String: Any],
               let eventType = eventDict["type"] as? String else {
-            print("Received unparsable JSON:\n\(jsonString)\n")
+            print("Received unparsable JSON:\n\(String(decoding: data, as: UTF8.self))\n")
             return
         }
         
         // Filter out noisy events to keep the console clean
-        let noisyEvents: Set<String> = [
-            "response.audio_transcript.delta",
-            "response.audio.done",
-            "response.content_part.added",
-            "response.content_part.done",
-            "response.output_item.added",
-            "response.output_item.done",
-            "rate_limits.updated",
-            "input_audio_buffer.speech_started",
-            "input_audio_buffer.speech_stopped",
-            "input_audio_buffer.committed",
-            "conversation.item.input_audio_transcription.delta",
-            "conversation.item.input_audio_transcription.completed",
-            "response.function_call_arguments.delta",
-            "response.mcp_call_arguments.delta",
-            "output_audio_buffer.started",
-            "output_audio_buffer.stopped",
-            "output_audio_buffer.cleared"
-        ]
-        
-        if !noisyEvents.contains(eventType) {
-            print("Received JSON:\n\(jsonString)\n")
+        if !Self.noisyDataChannelEvents.contains(eventType) {
+            print("Received JSON:\n\(String(decoding: data, as: UTF8.self))\n")
         }
         
         eventTypeStr = eventType
@@ -4459,7 +4506,7 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
                 if var convItem = conversationMap[itemId] {
                     convItem.text += delta
                     conversationMap[itemId] = convItem
-                    if let idx = conversation.firstIndex(where: { $0.id == itemId }) {
+                    if let idx = conversation.lastIndex(where: { $0.id == itemId }) {
                         conversation[idx].text = convItem.text
                     }
                 }
@@ -4473,7 +4520,7 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
                 if var convItem = conversationMap[itemId] {
                     convItem.text = transcript
                     conversationMap[itemId] = convItem
-                    if let idx = conversation.firstIndex(where: { $0.id == itemId }) {
+                    if let idx = conversation.lastIndex(where: { $0.id == itemId }) {
                         conversation[idx].text = transcript
                     }
                 }
@@ -4487,7 +4534,7 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
                 if var convItem = conversationMap[itemId] {
                     convItem.text = transcript
                     conversationMap[itemId] = convItem
-                    if let idx = conversation.firstIndex(where: { $0.id == itemId }) {
+                    if let idx = conversation.lastIndex(where: { $0.id == itemId }) {
                         conversation[idx].text = transcript
                     }
                 }
@@ -4736,7 +4783,8 @@ class WebRTCManager: NSObject, ObservableObject, @unchecked Sendable {
         ]
         
         do {
-            let jsonData = try JSONSerialization.data(withJSONObject: imageMessage)
+            // Base64 is full of "/"; don't let JSONSerialization inflate it to "\/"
+            let jsonData = try JSONSerialization.data(withJSONObject: imageMessage, options: .withoutEscapingSlashes)
             let buffer = RTCDataBuffer(data: jsonData, isBinary: false)
             dc.sendData(buffer)
             print("📹 Sent video frame to model")
@@ -4761,9 +4809,8 @@ extension WebRTCManager: AVCaptureVideoDataOutputSampleBufferDelegate {
         guard let imageBuffer = CMSampleBufferGetImageBuffer(sampleBuffer) else { return }
         
         let ciImage = CIImage(cvImageBuffer: imageBuffer)
-        let context = CIContext()
         
-        if let cgImage = context.createCGImage(ciImage, from: ciImage.extent) {
+        if let cgImage = videoFrameContext.createCGImage(ciImage, from: ciImage.extent) {
             let image = UIImage(cgImage: cgImage)
             
             // Compress the image
@@ -4897,11 +4944,32 @@ extension WebRTCManager: RTCDataChannelDelegate {
     
     func dataChannel(_ dataChannel: RTCDataChannel,
                      didReceiveMessageWith buffer: RTCDataBuffer) {
-        guard let message = String(data: buffer.data, encoding: .utf8) else {
-            return
+        // Events are parsed straight from the frame data; a String is only
+        // materialized if the event ends up being logged.
+        let message = buffer.data
+        
+        // Only schedule a main-queue hop when the inbox was empty, so a burst of
+        // transcript deltas is handled in one pass instead of one block per event.
+        let shouldScheduleDrain = dataChannelInboxLock.withLock { () -> Bool in
+            pendingDataChannelMessages.append(message)
+            return pendingDataChannelMessages.count == 1
         }
+        guard shouldScheduleDrain else { return }
+        
         DispatchQueue.main.async {
-            self.handleIncomingJSON(message)
+            self.drainPendingDataChannelMessages()
+        }
+    }
+    
+    private func drainPendingDataChannelMessages() {
+        let batch = dataChannelInboxLock.withLock { () -> [Data] in
+            let batch = pendingDataChannelMessages
+            pendingDataChannelMessages.removeAll(keepingCapacity: true)
+            return batch
+        }
+        
+        for message in batch {
+            handleIncomingJSON(message)
         }
     }
 }
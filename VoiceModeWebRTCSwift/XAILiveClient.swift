@@ -1,5 +1,6 @@
 import Foundation
 import AVFoundation
+import Accelerate
 
 /// A client for interacting with xAI's Grok Realtime API via WebSocket.
 /// Features:
@@ -47,6 +48,8 @@ class XAILiveClient: NSObject {
     
     // Audio chunk counter for debugging
     private var receivedAudioChunks = 0
+    // Non-audio delta events (transcripts, function args) skipped by the verbose log
+    private var suppressedDeltaEvents = 0
     
     // Tools for function calling
     private var tools: [[String: Any]] = []
@@ -56,6 +59,10 @@ class XAILiveClient: NSObject {
     private let maxReconnectAttempts = 5
     private var reconnectTimer: Timer?
     
+    // Constant control events, serialized once
+    private static let responseCreatePayload = "{\"type\":\"response.create\"}"
+    private static let responseCancelPayload = "{\"type\":\"response.cancel\"}"
+    
     // Callbacks
     var onConnectionStateChange: ((ConnectionState) -> Void)?
     var onMessageReceived: ((_ role: String, _ text: String, _ itemId: String, _ isDelta: Bool) -> Void)?
@@ -128,11 +135,14 @@ class XAILiveClient: NSObject {
         onConnectionStateChange?(.connecting)
         
         webSocketTask = urlSession.webSocketTask(with: request)
+        // The default 1 MiB limit fails the receive outright on oversized audio frames
+        webSocketTask?.maximumMessageSize = 16 * 1024 * 1024
         webSocketTask?.resume()
         
         isConnected = true
         sessionConfirmed = false
         receivedAudioChunks = 0
+        suppressedDeltaEvents = 0
         receiveMessage()
         
         // Send session update immediately - the API will respond with session.created/updated
@@ -166,7 +176,7 @@ class XAILiveClient: NSObject {
             ]
         ]
         sendJSON(event)
-        sendJSON(["type": "response.create"])
+        sendRawPayload(Self.responseCreatePayload)
     }
     
     // MARK: - Audio Setup
@@ -193,7 +203,7 @@ class XAILiveClient: NSObject {
             
             // Log first 5 chunks immediately, then every 50th
             if chunkCount <= 5 {
-                print("🎤 XAI: Audio chunk #\(chunkCount) (\(base64.count) bytes, RMS: \(String(format: "%.1f", rms)))")
+                print("🎤 XAI: Audio chunk #\(chunkCount) (\(base64.utf8.count) bytes, RMS: \(String(format: "%.1f", rms)))")
             } else if chunkCount % 50 == 0 {
                 print("🎤 XAI: Sending audio chunk #\(chunkCount) (RMS: \(String(format: "%.1f", rms)))")
             }
@@ -204,12 +214,10 @@ class XAILiveClient: NSObject {
             }
             
             // Send mic audio as input_audio_buffer.append
+            // Base64 never needs JSON escaping, so build the frame directly
+            // rather than running JSONSerialization on every mic chunk.
             if !self.isMuted {
-                let event: [String: Any] = [
-                    "type": "input_audio_buffer.append",
-                    "audio": base64
-                ]
-                self.sendJSON(event)
+                self.sendRawPayload("{\"type\":\"input_audio_buffer.append\",\"audio\":\"\(base64)\"}")
             }
         }
     }
@@ -286,7 +294,7 @@ class XAILiveClient: NSObject {
     }
     
     private func sendJSON(_ dict: [String: Any]) {
-        guard let data = try? JSONSerialization.data(withJSONObject: dict),
+        guard let data = try? JSONSerialization.data(withJSONObject: dict, options: .withoutEscapingSlashes),
               let string = String(data: data, encoding: .utf8) else { return }
         
         // Don't log every audio append
@@ -310,11 +318,10 @@ class XAILiveClient: NSObject {
             case .success(let message):
                 switch message {
                 case .string(let text):
-                    self.handleEvent(text)
+                    self.handleEvent(Data(text.utf8))
                 case .data(let data):
-                    if let text = String(data: data, encoding: .utf8) {
-                        self.handleEvent(text)
-                    }
+                    // Parse binary frames as-is instead of round-tripping through String
+                    self.handleEvent(data)
                 @unknown default:
                     break
                 }
@@ -355,17 +362,24 @@ class XAILiveClient: NSObject {
         }
     }
     
-    private func handleEvent(_ jsonString: String) {
-        guard let data = jsonString.data(using: .utf8),
-              let event = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
+    private func handleEvent(_ data: Data) {
+        guard let event = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
               let type = event["type"] as? String else { return }
         
-        // VERBOSE: Log ALL events to debug what xAI is sending
-        // Filter out only the most frequent ones
-        if type != "ping" && !type.contains("input_audio_buffer.append") {
+        // VERBOSE: Log events to debug what xAI is sending
+        // Filter out the most frequent ones. Delta events arrive many times per second:
+        // audio deltas are counted in their own case below, all others get a throttled count here.
+        if type.contains("delta") {
+            if !type.contains("output_audio.delta") && !type.contains("response.audio.delta") {
+                suppressedDeltaEvents += 1
+                if suppressedDeltaEvents == 1 || suppressedDeltaEvents % 100 == 0 {
+                    print("📥 XAI: \(suppressedDeltaEvents) delta events (latest: \(type))")
+                }
+            }
+        } else if type != "ping" && !type.contains("input_audio_buffer.append") {
             if type.contains("audio") || type.contains("response") {
                 print("📥 XAI Event: \(type) - Keys: \(event.keys.sorted())")
-            } else if !type.contains("delta") {
+            } else {
                 print("📥 XAI Event: \(type)")
             }
         }
@@ -428,7 +442,7 @@ class XAILiveClient: NSObject {
             // (AVAudioPlayerNode.stop() clears its internal buffer)
             
             // 3. Send cancellation to server to stop generation
-            sendJSON(["type": "response.cancel"])
+            sendRawPayload(Self.responseCancelPayload)
             
             receivedAudioChunks = 0  // Reset counter for new response
             
@@ -504,7 +518,7 @@ class XAILiveClient: NSObject {
     /// Manually trigger the assistant to generate a response (e.g. after tool results)
     func createResponse() {
         print("💬 XAI: Manually triggering response.create")
-        sendJSON(["type": "response.create"])
+        sendRawPayload(Self.responseCreatePayload)
     }
     
     // MARK: - Playback Logic
@@ -535,10 +549,11 @@ class XAILiveClient: NSObject {
         
         data.withUnsafeBytes { (rawBytes: UnsafeRawBufferPointer) in
             guard let pointer = rawBytes.bindMemory(to: Int16.self).baseAddress else { return }
-            for i in 0..<frameCount {
-                // Convert Int16 to Float [-1.0, 1.0]
-                floatChannel[i] = Float(pointer[i]) / 32768.0
-            }
+            // Convert Int16 to Float [-1.0, 1.0] in two vectorized passes
+            let length = vDSP_Length(frameCount)
+            var scale: Float = 32768.0
+            vDSP_vflt16(pointer, 1, floatChannel, 1, length)
+            vDSP_vsdiv(floatChannel, 1, &scale, floatChannel, 1, length)
         }
         
         playerNode.scheduleBuffer(pcmBuffer, at: nil, options: [], completionHandler: nil)
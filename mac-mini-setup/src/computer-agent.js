@@ -26,10 +26,12 @@ import {
 
 const SYSTEM_PROMPT_PATH = new URL('../ComputerAgentPrompt.md', import.meta.url);
 
+// Cached with the runtime tooling note already appended; it never changes per task
 let cachedSystemPrompt = null;
 async function loadSystemPrompt() {
   if (cachedSystemPrompt) return cachedSystemPrompt;
-  cachedSystemPrompt = await fs.readFile(SYSTEM_PROMPT_PATH, 'utf8');
+  const basePrompt = await fs.readFile(SYSTEM_PROMPT_PATH, 'utf8');
+  cachedSystemPrompt = buildAugmentedSystemPrompt(basePrompt);
   return cachedSystemPrompt;
 }
 
@@ -122,6 +124,11 @@ const STEP_SCHEMA = {
   required: ['thought', 'action']
 };
 
+const RESPONSE_FORMAT = {
+  type: 'json_schema',
+  json_schema: { name: 'computer_agent_step', schema: STEP_SCHEMA, strict: false }
+};
+
 function requireString(value, label) {
   if (typeof value !== 'string' || !value.trim()) {
     throw new Error(`${label} is required`);
@@ -172,7 +179,11 @@ function extractJson(text) {
   }
 }
 
-async function createOpenAIClient() {
+// One client per process so keep-alive connections to the API are reused across tasks
+let cachedClient = null;
+async function getOpenAIClient() {
+  if (cachedClient) return cachedClient;
+
   let apiKey = process.env.OPENAI_API_KEY;
   let baseURL = undefined;
 
@@ -187,7 +198,8 @@ async function createOpenAIClient() {
   }
 
   const { default: OpenAI } = await import('openai');
-  return new OpenAI({ apiKey, baseURL });
+  cachedClient = new OpenAI({ apiKey, baseURL });
+  return cachedClient;
 }
 
 function buildUserInput({ task, stepIndex, maxSteps, lastToolResult, history }) {
@@ -411,9 +423,8 @@ export async function runComputerAgent(options, bridgeContext) {
 
   requireString(task, 'task');
 
-  const client = await createOpenAIClient();
-  const basePrompt = await loadSystemPrompt();
-  const systemPrompt = buildAugmentedSystemPrompt(basePrompt);
+  const client = await getOpenAIClient();
+  const systemPrompt = await loadSystemPrompt();
 
   const history = [];
   let lastToolResult = null;
@@ -445,10 +456,7 @@ export async function runComputerAgent(options, bridgeContext) {
           ]
         }
       ],
-      response_format: {
-        type: 'json_schema',
-        json_schema: { name: 'computer_agent_step', schema: STEP_SCHEMA, strict: false }
-      },
+      response_format: RESPONSE_FORMAT,
       max_completion_tokens: 4096
     });
 
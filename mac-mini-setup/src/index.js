@@ -679,6 +679,22 @@ function authenticate(req, res, next) {
 // MCP Protocol Handler (Shared between HTTP and WebSocket)
 // ============================================================================
 
+/**
+ * Serialize a JSON-RPC response once and log a short preview of it.
+ * Tool results can carry large payloads (e.g. screenshots), so the same
+ * string is reused for the log line and the transport.
+ * @param {object} response - The JSON-RPC response
+ * @param {string} method - The request method, for logging
+ * @returns {string} - The serialized response
+ */
+function serializeMcpResponse(response, method) {
+  const payload = JSON.stringify(response);
+  if (response.result !== undefined) {
+    console.log(`📤 MCP Response for ${method}:`, payload.substring(0, 200));
+  }
+  return payload;
+}
+
 /**
  * Process an MCP JSON-RPC request and return the response object.
  * @param {object} request - The JSON-RPC request
@@ -761,7 +777,6 @@ async function processMcpRequest(request, context = {}) {
         };
     }
 
-    console.log(`📤 MCP Response for ${method}:`, JSON.stringify(result).substring(0, 200));
     return { jsonrpc: '2.0', result, id };
 
   } catch (error) {
@@ -777,7 +792,7 @@ async function processMcpRequest(request, context = {}) {
 // HTTP Endpoint
 app.post('/mcp', authenticate, async (req, res) => {
   const response = await processMcpRequest(req.body);
-  res.json(response);
+  res.type('application/json').send(serializeMcpResponse(response, req.body?.method));
 });
 
 // Health check endpoint
@@ -823,7 +838,7 @@ wss.on('connection', (ws, req) => {
       // Use the shared MCP request handler with context
       const response = await processMcpRequest(request, context);
       if (response) {
-        ws.send(JSON.stringify(response));
+        ws.send(serializeMcpResponse(response, request.method));
       }
     } catch (error) {
       console.error(`❌ WS Error:`, error);